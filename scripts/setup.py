@@ -12,23 +12,41 @@ This script automates the setup of a development environment including:
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 
-def run_command(cmd: str, description: str = "") -> bool:
-    """Run a shell command and return success status."""
-    print(f"🔧 {description or cmd}")
+def run_command(cmd: str, description: str = "", tag: str = "") -> bool:
+    """Run a shell command, streaming its output, and return success status.
+
+    Output lines are printed as they arrive (stderr merged into stdout) and
+    prefixed with ``tag`` so concurrent steps stay readable.
+    """
+    prefix = f"[{tag}] " if tag else ""
+    print(f"🔧 {prefix}{description or cmd}")
     try:
-        result = subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
-        if result.stdout:
-            print(f"   {result.stdout.strip()}")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Failed: {e}")
-        if e.stderr:
-            print(f"   Error: {e.stderr.strip()}")
+        process = subprocess.Popen(
+            cmd,
+            shell=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+    except OSError as e:
+        print(f"❌ {prefix}Failed: {e}")
         return False
 
+    with process:
+        for line in process.stdout:
+            print(f"   {prefix}{line.rstrip()}")
+        returncode = process.wait()
+
+    if returncode != 0:
+        print(f"❌ {prefix}Failed: '{cmd}' exited with status {returncode}")
+        return False
+    return True
+
 
 def setup_python_environment():
     """Set up Python virtual environment and dependencies."""
@@ -36,12 +54,12 @@ def setup_python_environment():
     
     # Check if virtual environment exists
     if not Path("venv").exists():
-        if not run_command("python3 -m venv venv", "Creating virtual environment"):
+        if not run_command("python3 -m venv venv", "Creating virtual environment", tag="python"):
             return False
     
     # Install Python dependencies
     pip_cmd = "./venv/bin/pip" if os.name != "nt" else ".\\venv\\Scripts\\pip"
-    if not run_command(f"{pip_cmd} install -e .", "Installing Python dependencies"):
+    if not run_command(f"{pip_cmd} install -e .", "Installing Python dependencies", tag="python"):
         return False
     
     return True
@@ -51,12 +69,36 @@ def setup_node_environment():
     """Set up Node.js dependencies."""
     print("📦 Setting up Node.js environment...")
     
-    if not run_command("npm install", "Installing Node.js dependencies"):
+    if not run_command("npm install", "Installing Node.js dependencies", tag="node"):
         return False
     
     return True
 
 
+def setup_dependencies():
+    """Install Python and Node.js dependencies concurrently.
+
+    Both installs are independent and network-bound, so running them side by
+    side brings setup time down to roughly the slower of the two.
+    """
+    install_steps = {
+        "Python Environment": setup_python_environment,
+        "Node.js Environment": setup_node_environment,
+    }
+    
+    failed_steps = []
+    with ThreadPoolExecutor(max_workers=len(install_steps)) as executor:
+        futures = {executor.submit(func): name for name, func in install_steps.items()}
+        for future in as_completed(futures):
+            if not future.result():
+                failed_steps.append(futures[future])
+    
+    for step_name in failed_steps:
+        print(f"❌ Dependency step failed: {step_name}")
+    
+    return not failed_steps
+
+
 def setup_configuration():
     """Set up configuration files."""
     print("⚙️ Setting up configuration...")
@@ -97,10 +139,14 @@ def verify_setup():
         "vibe_worldbuilding"
     ]
     
-    for pkg in critical_imports:
-        if not run_command(f"{python_cmd} -c 'import {pkg}; print(\"✅ {pkg} imported successfully\")'", f"Testing {pkg} import"):
-            print(f"❌ Critical dependency missing: {pkg}")
-            return False
+    # Import everything in one interpreter; only probe packages individually on failure
+    import_script = "; ".join(f"import {pkg}" for pkg in critical_imports)
+    import_script += "; print('✅ All critical packages imported successfully')"
+    if not run_command(f'{python_cmd} -c "{import_script}"', "Testing critical imports"):
+        for pkg in critical_imports:
+            if not run_command(f'{python_cmd} -c "import {pkg}"', f"Testing {pkg} import"):
+                print(f"❌ Critical dependency missing: {pkg}")
+        return False
     
     # Test basic MCP functionality if tests exist
     test_file = Path("tests/run_tests.py")
@@ -122,8 +168,7 @@ def main():
         return 1
     
     steps = [
-        ("Python Environment", setup_python_environment),
-        ("Node.js Environment", setup_node_environment),
+        ("Dependencies", setup_dependencies),
         ("Configuration", setup_configuration),
         ("Verification", verify_setup),
     ]
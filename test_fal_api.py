@@ -8,19 +8,10 @@ import asyncio
 import os
 from pathlib import Path
 
-# Load environment from .env file (same as MCP server does)
-def load_env_file():
-    env_path = Path(__file__).parent / ".env"
-    if env_path.exists():
-        with open(env_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, value = line.split("=", 1)
-                    if key.strip() not in os.environ:
-                        os.environ[key.strip()] = value.strip()
+from vibe_worldbuilding.utils.env_file import load_env_file
 
-load_env_file()
+# Load environment from .env file (same as MCP server does)
+load_env_file(Path(__file__).parent / ".env")
 
 FAL_API_KEY = os.environ.get("FAL_KEY")
 print(f"FAL_API_KEY loaded: {'Yes' if FAL_API_KEY else 'No'}")
@@ -32,10 +23,10 @@ if not FAL_API_KEY:
 
 # Test imports
 try:
-    import requests
-    print("✅ requests library available")
+    import httpx
+    print("✅ httpx library available")
 except ImportError:
-    print("❌ requests library not available")
+    print("❌ httpx library not available")
     exit(1)
 
 async def test_fal_api():
@@ -64,7 +55,8 @@ async def test_fal_api():
         print(f"📝 Prompt: {payload['prompt']}")
         
         # Add timeout to prevent hanging
-        response = requests.post(url, json=payload, headers=headers, timeout=30.0)
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            response = await client.post(url, json=payload, headers=headers)
         
         print(f"📊 Response status: {response.status_code}")
         print(f"📏 Response size: {len(response.content)} bytes")
@@ -82,10 +74,10 @@ async def test_fal_api():
             print(f"❌ FAL API call failed!")
             print(f"📄 Response text: {response.text[:200]}")
             
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         print("⏰ FAL API call timed out after 30 seconds")
         return False
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print("🌐 Connection error - can't reach FAL API")
         return False
     except Exception as e:
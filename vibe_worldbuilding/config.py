@@ -1,19 +1,14 @@
 """Configuration and constants for the Vibe Worldbuilding MCP."""
 
+import functools
 import os
 from pathlib import Path
+from typing import Optional
 
-# Load environment variables from .env file
-try:
-    from dotenv import load_dotenv
+from .utils.env_file import load_env_file
 
-    # Look for .env in the project root
-    env_path = Path(__file__).parent.parent / ".env"
-    if env_path.exists():
-        load_dotenv(env_path)
-except ImportError:
-    # dotenv not available, just use system environment
-    pass
+# Load environment variables from the .env file in the project root
+load_env_file(Path(__file__).parent.parent / ".env")
 
 # Version information
 VERSION = "1.0.0"
@@ -21,15 +16,79 @@ SERVER_NAME = "vibe-worldbuilding"
 
 # External API configuration
 FAL_API_URL = "https://fal.run/fal-ai/imagen4/preview"
-FAL_API_KEY = os.environ.get("FAL_KEY")
 
-# Check for optional dependencies
-try:
-    import requests
 
-    FAL_AVAILABLE = True
-except ImportError:
-    FAL_AVAILABLE = False
+# FAL_API_KEY, FAL_AVAILABLE and HTTPX_AVAILABLE are resolved on first access
+# (see __getattr__ below), so importing config never imports the HTTP clients
+@functools.cache
+def _load_fal_key() -> Optional[str]:
+    """Read the FAL API key from the environment."""
+    return os.environ.get("FAL_KEY")
+
+
+@functools.cache
+def _probe_requests() -> bool:
+    """Check whether the optional requests dependency is installed."""
+    try:
+        import requests  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@functools.cache
+def _probe_httpx() -> bool:
+    """Check whether the optional httpx dependency is installed."""
+    try:
+        import httpx  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+_LAZY_SETTINGS = {
+    "FAL_API_KEY": _load_fal_key,
+    "FAL_AVAILABLE": _probe_requests,
+    "HTTPX_AVAILABLE": _probe_httpx,
+}
+
+
+def __getattr__(name: str):
+    """Resolve lazily computed settings on first access (PEP 562)."""
+    try:
+        loader = _LAZY_SETTINGS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return loader()
+
+# Shared FAL HTTP client, created on first use so its connection pool (and
+# HTTP/2 session) is reused across image generations instead of paying a
+# TCP + TLS handshake per call
+_fal_client = None
+
+
+def get_fal_client() -> "httpx.AsyncClient":
+    """Return the shared async HTTP client used for FAL API calls."""
+    global _fal_client
+    if _fal_client is None:
+        import importlib.util
+
+        import httpx
+
+        _fal_client = httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=8),
+        )
+    return _fal_client
+
+
+async def close_fal_client() -> None:
+    """Close the shared FAL HTTP client if it was created."""
+    global _fal_client
+    if _fal_client is not None:
+        await _fal_client.aclose()
+        _fal_client = None
 
 # Default values
 DEFAULT_IMAGE_STYLE = "fantasy illustration"
@@ -53,4 +112,5 @@ TAXONOMY_OVERVIEW_SUFFIX = "-overview"
 
 # Build timeouts and limits
 BUILD_TIMEOUT_SECONDS = 300  # 5 minutes
+IMAGE_GENERATION_TIMEOUT_SECONDS = 60  # Background entry image generation
 MAX_DESCRIPTION_LINES = 3  # Optimized for detailed image prompts
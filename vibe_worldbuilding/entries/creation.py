@@ -4,19 +4,19 @@ This module handles the creation of detailed world entries with proper formattin
 frontmatter, image generation, and integration with the world context system.
 """
 
+import asyncio
+import logging
+import os
 from pathlib import Path
 from typing import Any
 
 import mcp.types as types
 
 from ..config import (
-    FAL_API_KEY,
-    FAL_API_URL,
-    FAL_AVAILABLE,
     IMAGE_EXTENSION,
+    IMAGE_GENERATION_TIMEOUT_SECONDS,
     MARKDOWN_EXTENSION,
     MAX_DESCRIPTION_LINES,
-    TAXONOMY_OVERVIEW_SUFFIX,
 )
 from ..utils.content_parsing import (
     add_frontmatter_to_content,
@@ -27,14 +27,25 @@ from .stub_generation import generate_stub_analysis
 from .utilities import (
     clean_name,
     create_world_context_prompt,
-    extract_taxonomy_context,
+    get_existing_entries,
     get_existing_entries_with_descriptions,
-    get_existing_taxonomies,
+    invalidate_entry_cache,
+    load_taxonomies,
 )
+from ..utils.file_ops import load_with_stat_cache
 from ..utils.path_helpers import resolve_world_path
 
-if FAL_AVAILABLE:
-    import requests
+logger = logging.getLogger(__name__)
+
+# Characters of the world overview included in entry context
+WORLD_OVERVIEW_PREVIEW_CHARS = 500
+
+# Truncated world overview keyed by path -> (mtime_ns, size, text)
+_WORLD_OVERVIEW_CACHE: dict[str, tuple[int, int, str]] = {}
+
+# In-flight background image generations; holding references keeps them from
+# being garbage collected before they finish
+_PENDING_IMAGE_TASKS: set[asyncio.Task] = set()
 
 
 async def create_world_entry(
@@ -51,29 +62,28 @@ async def create_world_entry(
     Returns:
         List containing success message with entry details and optional stub analysis
     """
-    # LOGGING: Validate that new code is being executed
-    import datetime
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] ===== FUNCTION ENTRY =====")
-    print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] Arguments: {arguments}")
-    
+    logger.debug("create_world_entry called with arguments: %s", arguments)
+
     if not arguments:
-        print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] No arguments provided, returning error")
+        logger.debug("No arguments provided, returning error")
         return [types.TextContent(type="text", text="Error: No arguments provided")]
 
     world_directory = arguments.get("world_directory", "")
     taxonomy = arguments.get("taxonomy", "")
     entry_name = arguments.get("entry_name", "")
     entry_content = arguments.get("entry_content", "")
-    
-    print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] Parsed arguments:")
-    print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG]   world_directory: {world_directory}")
-    print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG]   taxonomy: {taxonomy}")
-    print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG]   entry_name: {entry_name}")
-    print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG]   has_content: {bool(entry_content.strip())}")
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Parsed arguments: world_directory=%s taxonomy=%s entry_name=%s has_content=%s",
+            world_directory,
+            taxonomy,
+            entry_name,
+            bool(entry_content.strip()),
+        )
 
     if not all([world_directory, taxonomy, entry_name]):
-        print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] Missing required arguments, returning error")
+        logger.debug("Missing required arguments, returning error")
         return [
             types.TextContent(
                 type="text",
@@ -82,66 +92,56 @@ async def create_world_entry(
         ]
 
     try:
-        print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] Resolving world directory path...")
         # CRITICAL FIX: Resolve world directory against base directory
         world_path = resolve_world_path(world_directory)
-        print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] Resolved world_path: {world_path}")
-        
-        if not world_path.exists():
-            print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] World directory does not exist: {world_path}")
+        logger.debug("Resolved world_path: %s", world_path)
+
+        # Hot-path paths below are built as plain strings to avoid Path allocations
+        world_path_str = str(world_path)
+        if not os.path.exists(world_path_str):
+            logger.debug("World directory does not exist: %s", world_path)
             return [
                 types.TextContent(
                     type="text",
                     text=f"Error: World directory {world_path} does not exist",
                 )
             ]
-        print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] World directory exists, continuing...")
 
-        print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] Cleaning names...")
         # Clean names for file system use
         clean_taxonomy = clean_name(taxonomy)
         clean_entry = clean_name(entry_name)
-        print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] clean_taxonomy: {clean_taxonomy}, clean_entry: {clean_entry}")
-
-        print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] Checking taxonomy exists...")
-        # Check if taxonomy exists before proceeding
-        taxonomy_overview_file = world_path / "taxonomies" / f"{clean_taxonomy}{TAXONOMY_OVERVIEW_SUFFIX}.md"
-        print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] taxonomy_overview_file: {taxonomy_overview_file}")
-        print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] file exists: {taxonomy_overview_file.exists()}")
-        
-        if not taxonomy_overview_file.exists():
-            print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] Taxonomy does not exist, getting existing taxonomies...")
-            existing_taxonomies = get_existing_taxonomies(world_path)
+        logger.debug(
+            "clean_taxonomy: %s, clean_entry: %s", clean_taxonomy, clean_entry
+        )
+
+        # Load every taxonomy and its context in one pass, then check ours exists
+        taxonomies = load_taxonomies(world_path)
+        existing_taxonomies = list(taxonomies)
+
+        if clean_taxonomy not in taxonomies:
+            logger.debug("Taxonomy not found: %s", clean_taxonomy)
             taxonomy_list = ", ".join(existing_taxonomies) if existing_taxonomies else "None"
-            print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] TAXONOMY VALIDATION FAILED - returning error")
             return [
                 types.TextContent(
                     type="text",
                     text=f"Error: Taxonomy '{taxonomy}' does not exist. Available taxonomies: {taxonomy_list}\n\nUse the create_taxonomy tool to create this taxonomy first.",
                 )
             ]
-        
-        print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] Taxonomy validation passed, continuing...")
-
-        print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] Extracting taxonomy context...")
-        # Extract taxonomy context if available
-        taxonomy_context = extract_taxonomy_context(world_path, clean_taxonomy)
-        print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] taxonomy_context length: {len(taxonomy_context) if taxonomy_context else 0}")
-
-        print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] Getting world context...")
-        # Get world context for generating well-connected entries
-        existing_taxonomies = get_existing_taxonomies(world_path)
-        print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] existing_taxonomies: {existing_taxonomies}")
-        
-        existing_entries = get_existing_entries_with_descriptions(world_path)
-        print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] existing_entries count: {len(existing_entries) if existing_entries else 0}")
-
-        print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] Getting world overview...")
-        # Get world overview if available
-        world_overview = _get_world_overview(world_path)
-        print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] world_overview length: {len(world_overview) if world_overview else 0}")
-
-        print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] Creating world context prompt...")
+
+        taxonomy_context = taxonomies[clean_taxonomy]
+
+        # Get world context for generating well-connected entries. The
+        # context-only first phase needs just entry names, which come from file
+        # names, so only the creation phase reads entry frontmatter.
+        has_content = bool(entry_content.strip())
+        if has_content:
+            existing_entries = get_existing_entries_with_descriptions(world_path)
+        else:
+            existing_entries = get_existing_entries(world_path)
+
+        # Get world overview if available (file I/O runs off the event loop)
+        world_overview = await asyncio.to_thread(_get_world_overview, world_path_str)
+
         # Create comprehensive world context for the LLM
         world_context = create_world_context_prompt(
             existing_taxonomies,
@@ -150,15 +150,24 @@ async def create_world_entry(
             world_overview,
             taxonomy,
         )
-        print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] world_context created, length: {len(world_context)}")
 
-        print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] Checking if entry_content provided...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "World context built: taxonomy_context=%d chars, taxonomies=%s, "
+                "entries=%d, world_overview=%d chars, world_context=%d chars",
+                len(taxonomy_context),
+                existing_taxonomies,
+                len(existing_entries),
+                len(world_overview),
+                len(world_context),
+            )
+
         # Always show context first, then handle entry creation
-        if entry_content.strip():
-            print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] Entry content provided, creating entry file...")
+        if has_content:
             # Create the entry file
-            entry_file = _create_entry_file(
-                world_path,
+            await asyncio.to_thread(
+                _create_entry_file,
+                world_path_str,
                 clean_taxonomy,
                 clean_entry,
                 entry_name,
@@ -166,29 +175,44 @@ async def create_world_entry(
                 taxonomy,
                 taxonomy_context,
             )
-            print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] Entry file created: {entry_file}")
+            # Relative to the world directory, as shown in the response
+            relative_path = os.path.join(
+                "entries", clean_taxonomy, clean_entry + MARKDOWN_EXTENSION
+            )
+            logger.debug("Entry file created: %s", relative_path)
 
-            print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] Generating optimized entry image...")
-            # Generate optimized image prompt and image if FAL API is available
-            image_info = await _generate_optimized_entry_image(
+            # Start image generation in the background if FAL API is available
+            image_info = _schedule_entry_image(
                 world_path,
                 clean_taxonomy,
                 clean_entry,
                 entry_name,
                 entry_content,
             )
-            print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] Image generation completed: {image_info}")
 
-            print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] Generating stub analysis...")
-            # Generate auto-stub analysis
+            # Generate auto-stub analysis from the world scan above, including
+            # the entry just written, instead of rescanning the world
+            entries_after_write = [
+                entry for entry in existing_entries if entry["file"] != relative_path
+            ]
+            entries_after_write.append(
+                {
+                    "name": clean_entry.replace("-", " ").title(),
+                    "taxonomy": clean_taxonomy,
+                    "description": "",
+                    "file": relative_path,
+                }
+            )
             stub_analysis_info = generate_stub_analysis(
-                world_path, entry_name, taxonomy, entry_content
+                world_path,
+                entry_name,
+                taxonomy,
+                entry_content,
+                existing_taxonomies,
+                entries_after_write,
             )
-            print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] Stub analysis completed: {stub_analysis_info}")
 
-            print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] Creating response...")
             # Create response with context + creation result
-            relative_path = str(entry_file.relative_to(world_path))
             context_info = (
                 f"\n\nTaxonomy context included: {taxonomy_context[:100]}..."
                 if taxonomy_context
@@ -196,8 +220,7 @@ async def create_world_entry(
             )
 
             response_text = f"# World Context Used for '{entry_name}'\n\n{world_context}\n\n---\n\n## Entry Created Successfully!\n\nSaved to: {relative_path}{context_info}\n\nThe entry includes:\n1. YAML frontmatter with description\n2. Your detailed content\n3. Taxonomy classification footer{image_info}{stub_analysis_info}\n\n**Note**: Review the content above - it should include crosslinks to existing entries based on the context provided."
-            
-            print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] Returning success response, length: {len(response_text)}")
+
             return [
                 types.TextContent(
                     type="text",
@@ -205,11 +228,10 @@ async def create_world_entry(
                 )
             ]
         else:
-            print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] No entry content provided, returning context only...")
+            logger.debug("No entry content provided, returning context only")
             # Return world context for entry generation
             response_text = f"# World Context for Creating '{entry_name}' in {taxonomy}\n\n{world_context}\n\n---\n\n**Next Step**: Generate entry content that references existing entries using the linking format provided above, then call this tool again with your `entry_content`."
-            
-            print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] Returning context response, length: {len(response_text)}")
+
             return [
                 types.TextContent(
                     type="text",
@@ -218,42 +240,49 @@ async def create_world_entry(
             ]
 
     except Exception as e:
-        print(f"[{timestamp}] [CREATE_WORLD_ENTRY DEBUG] Exception occurred: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("create_world_entry failed")
         return [
             types.TextContent(type="text", text=f"Error creating world entry: {str(e)}")
         ]
 
 
-def _get_world_overview(world_path: Path) -> str:
+def _get_world_overview(world_path: str) -> str:
     """Get world overview content for context."""
-    world_overview = ""
-    overview_path = world_path / "overview" / "world-overview.md"
-    if overview_path.exists():
-        try:
-            with open(overview_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                world_overview = content[:500] + ("..." if len(content) > 500 else "")
-        except Exception:
-            pass
-    return world_overview
+    overview_path = os.path.join(world_path, "overview", "world-overview.md")
+    try:
+        return load_with_stat_cache(
+            overview_path, _WORLD_OVERVIEW_CACHE, _read_world_overview
+        )
+    except Exception:
+        return ""
+
+
+def _read_world_overview(overview_path: str) -> str:
+    """Read the world overview, truncated to the first 500 characters."""
+    # UTF-8 needs at most 4 bytes per character, so this covers one character
+    # past the preview (to detect truncation) without reading the whole file
+    with open(overview_path, "rb") as f:
+        raw = f.read(4 * (WORLD_OVERVIEW_PREVIEW_CHARS + 1))
+    content = raw.decode("utf-8", errors="replace")
+    return content[:WORLD_OVERVIEW_PREVIEW_CHARS] + (
+        "..." if len(content) > WORLD_OVERVIEW_PREVIEW_CHARS else ""
+    )
 
 
 def _create_entry_file(
-    world_path: Path,
+    world_path: str,
     clean_taxonomy: str,
     clean_entry: str,
     entry_name: str,
     entry_content: str,
     taxonomy: str,
     taxonomy_context: str,
-) -> Path:
+) -> str:
     """Create the entry file with proper formatting and frontmatter."""
-    entry_path = world_path / "entries" / clean_taxonomy
-    entry_path.mkdir(parents=True, exist_ok=True)
+    entry_path = os.path.join(world_path, "entries", clean_taxonomy)
+    os.makedirs(entry_path, exist_ok=True)
 
-    entry_file = entry_path / f"{clean_entry}{MARKDOWN_EXTENSION}"
+    entry_file = os.path.join(entry_path, clean_entry + MARKDOWN_EXTENSION)
 
     # Extract description for frontmatter
     description = extract_description_from_content(entry_content)
@@ -263,55 +292,98 @@ def _create_entry_file(
     if taxonomy_context:
         frontmatter["taxonomyContext"] = taxonomy_context
 
-    # Add frontmatter to content
-    final_content = add_frontmatter_to_content(entry_content, frontmatter)
-
-    # Add taxonomy footer
-    final_content += f"\n\n---\n*Entry in {taxonomy.title()} taxonomy*\n"
-
-    with open(entry_file, "w", encoding="utf-8") as f:
-        f.write(final_content)
+    # Assemble frontmatter, content and taxonomy footer, then encode and write once
+    payload = "".join(
+        [
+            add_frontmatter_to_content(entry_content, frontmatter),
+            "\n\n---\n*Entry in ",
+            taxonomy.title(),
+            " taxonomy*\n",
+        ]
+    ).encode("utf-8")
+    with open(entry_file, "wb") as f:
+        f.write(payload)
+    invalidate_entry_cache(entry_file)
 
     return entry_file
 
 
-async def _generate_optimized_entry_image(
+def _schedule_entry_image(
     world_path: Path,
     clean_taxonomy: str,
     clean_entry: str,
     entry_name: str,
     entry_content: str,
 ) -> str:
-    """Generate an optimized image using the new prompt system."""
-    # TEMPORARILY DISABLED: Image generation is causing the tool to hang
-    # TODO: Debug and re-enable image generation
-    return ""
-    
-    # Original code commented out to prevent hanging:
-    # if not (FAL_AVAILABLE and FAL_API_KEY):
-    #     return ""
-    # 
-    # try:
-    #     # Create the entry file path for our new image tools
-    #     entry_file_path = world_path / "entries" / clean_taxonomy / f"{clean_entry}{MARKDOWN_EXTENSION}"
-    #     
-    #     # Use the existing generate_image_from_markdown_file function which now checks for
-    #     # image_prompt in frontmatter and uses optimized prompts
-    #     from ..tools.images import generate_image_from_markdown_file
-    #     
-    #     result = await generate_image_from_markdown_file({
-    #         "filepath": str(entry_file_path),
-    #         "style": "fantasy illustration",
-    #         "aspect_ratio": "1:1"
-    #     })
-    #     
-    #     if result and result[0].text.startswith("Successfully generated"):
-    #         return f"\n4. Generated optimized image: images/{clean_taxonomy}/{clean_entry}{IMAGE_EXTENSION}"
-    #     
-    # except Exception:
-    #     pass  # Silently continue if image generation fails
-    # 
-    # return ""
-
-
-# Old _extract_visual_elements function removed - now using optimized image prompt system
+    """Start background image generation for a new entry.
+
+    Generation only runs when the entry carries an optimized image_prompt in
+    its frontmatter; the tool response returns without waiting for FAL.
+    """
+    from ..config import FAL_API_KEY, HTTPX_AVAILABLE
+
+    if not (HTTPX_AVAILABLE and FAL_API_KEY):
+        return ""
+
+    frontmatter, _ = extract_frontmatter(entry_content)
+    if not frontmatter.get("image_prompt"):
+        return ""
+
+    task = asyncio.create_task(
+        _generate_optimized_entry_image(
+            world_path, clean_taxonomy, clean_entry, entry_name
+        )
+    )
+    _PENDING_IMAGE_TASKS.add(task)
+    task.add_done_callback(_PENDING_IMAGE_TASKS.discard)
+
+    return f"\n4. Image generation in progress: images/{clean_taxonomy}/{clean_entry}{IMAGE_EXTENSION}"
+
+
+async def _generate_optimized_entry_image(
+    world_path: Path,
+    clean_taxonomy: str,
+    clean_entry: str,
+    entry_name: str,
+) -> None:
+    """Generate an optimized image for an entry using the new prompt system."""
+    entry_file_path = world_path / "entries" / clean_taxonomy / f"{clean_entry}{MARKDOWN_EXTENSION}"
+
+    # Uses the image_prompt in frontmatter and saves the image into the world
+    from ..tools.images import generate_image_from_markdown_file
+
+    try:
+        result = await asyncio.wait_for(
+            generate_image_from_markdown_file(
+                {
+                    "filepath": str(entry_file_path),
+                    "style": "fantasy illustration",
+                    "aspect_ratio": "1:1",
+                }
+            ),
+            timeout=IMAGE_GENERATION_TIMEOUT_SECONDS,
+        )
+    except asyncio.TimeoutError:
+        logger.warning(
+            "Image generation for '%s' timed out after %ss",
+            entry_name,
+            IMAGE_GENERATION_TIMEOUT_SECONDS,
+        )
+        return
+
+    if result and result[0].text.startswith("Successfully generated"):
+        logger.debug("Image generated for '%s'", entry_name)
+    else:
+        logger.warning(
+            "Image generation for '%s' failed: %s",
+            entry_name,
+            result[0].text if result else "no result",
+        )
+
+
+async def wait_for_pending_images(
+    timeout: float = IMAGE_GENERATION_TIMEOUT_SECONDS,
+) -> None:
+    """Wait for in-flight background image generations, e.g. before shutdown."""
+    if _PENDING_IMAGE_TASKS:
+        await asyncio.wait(set(_PENDING_IMAGE_TASKS), timeout=timeout)
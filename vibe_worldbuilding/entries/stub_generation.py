@@ -6,7 +6,7 @@ and creates minimal stub entries for future development.
 """
 
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import mcp.types as types
 
@@ -87,12 +87,23 @@ async def create_stub_entries(
 
 
 def generate_stub_analysis(
-    world_path: Path, entry_name: str, taxonomy: str, entry_content: str
+    world_path: Path,
+    entry_name: str,
+    taxonomy: str,
+    entry_content: str,
+    existing_taxonomies: Optional[List[str]] = None,
+    existing_entries: Optional[List[Dict[str, str]]] = None,
 ) -> str:
-    """Generate the auto-stub analysis section for entry creation response."""
+    """Generate the auto-stub analysis section for entry creation response.
+
+    Callers that already scanned the world can pass the taxonomy and entry
+    lists to skip rescanning it.
+    """
     try:
-        existing_taxonomies = get_existing_taxonomies(world_path)
-        existing_entries = get_existing_entries_with_descriptions(world_path)
+        if existing_taxonomies is None:
+            existing_taxonomies = get_existing_taxonomies(world_path)
+        if existing_entries is None:
+            existing_entries = get_existing_entries_with_descriptions(world_path)
 
         # Create a concise analysis prompt
         analysis_info = f"""
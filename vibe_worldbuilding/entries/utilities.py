@@ -4,10 +4,22 @@ This module contains helper functions used across the entries package
 for name cleaning, context extraction, and world analysis.
 """
 
+import os
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple, Union
 
 from ..config import MARKDOWN_EXTENSION, TAXONOMY_OVERVIEW_SUFFIX
+from ..utils.content_parsing import extract_frontmatter
+from ..utils.file_ops import load_with_stat_cache
+
+# Parsed-file caches keyed by path string -> (mtime_ns, size, value), so
+# repeated entry creation re-reads only files that changed on disk
+_TAXONOMY_CONTEXT_CACHE: Dict[str, Tuple[int, int, str]] = {}
+_TAXONOMY_LIST_CACHE: Dict[str, Tuple[int, int, List[str]]] = {}
+_ENTRY_DESCRIPTION_CACHE: Dict[str, Tuple[int, int, str]] = {}
+
+# Read size when scanning entry files for their frontmatter
+_FRONTMATTER_CHUNK_SIZE = 2048
 
 
 def clean_name(name: str) -> str:
@@ -23,62 +35,137 @@ def extract_taxonomy_context(world_path: Path, clean_taxonomy: str) -> str:
         / f"{clean_taxonomy}{TAXONOMY_OVERVIEW_SUFFIX}{MARKDOWN_EXTENSION}"
     )
 
-    if not taxonomy_overview_path.exists():
+    try:
+        return load_with_stat_cache(
+            taxonomy_overview_path,
+            _TAXONOMY_CONTEXT_CACHE,
+            _read_taxonomy_description,
+        )
+    except Exception:
         return ""
 
-    try:
-        with open(taxonomy_overview_path, "r", encoding="utf-8") as f:
-            content = f.read()
 
-        # Extract the description section
-        lines = content.split("\n")
-        in_description = False
-        description_lines = []
+def _read_taxonomy_description(taxonomy_overview_path: Union[str, Path]) -> str:
+    """Read the ## Description section of a taxonomy overview as one line."""
+    with open(taxonomy_overview_path, "r", encoding="utf-8") as f:
+        content = f.read()
 
-        for line in lines:
-            if line.strip() == "## Description":
-                in_description = True
-                continue
-            elif line.startswith("## ") and in_description:
-                break
-            elif in_description and line.strip():
-                description_lines.append(line.strip())
+    # Extract the description section
+    lines = content.split("\n")
+    in_description = False
+    description_lines = []
 
-        return " ".join(description_lines) if description_lines else ""
-    except Exception:
-        return ""
+    for line in lines:
+        if line.strip() == "## Description":
+            in_description = True
+            continue
+        elif line.startswith("## ") and in_description:
+            break
+        elif in_description and line.strip():
+            description_lines.append(line.strip())
+
+    return " ".join(description_lines) if description_lines else ""
 
 
 def get_existing_taxonomies(world_path: Path) -> List[str]:
     """Get a list of existing taxonomies in the world."""
-    taxonomies = []
-    taxonomies_path = world_path / "taxonomies"
+    try:
+        # Keyed on the directory's mtime, which changes when files are added or removed
+        taxonomies = load_with_stat_cache(
+            world_path / "taxonomies", _TAXONOMY_LIST_CACHE, _scan_taxonomy_names
+        )
+    except OSError:
+        return []
+
+    return list(taxonomies)
 
-    if taxonomies_path.exists():
-        for file_path in taxonomies_path.glob(
-            f"*{TAXONOMY_OVERVIEW_SUFFIX}{MARKDOWN_EXTENSION}"
-        ):
-            taxonomy_name = file_path.stem.replace(TAXONOMY_OVERVIEW_SUFFIX, "")
-            taxonomies.append(taxonomy_name)
+
+def _scan_taxonomy_names(taxonomies_path: Path) -> List[str]:
+    """List taxonomy names from the overview files in a taxonomies directory."""
+    taxonomies = []
+    for file_path in taxonomies_path.glob(
+        f"*{TAXONOMY_OVERVIEW_SUFFIX}{MARKDOWN_EXTENSION}"
+    ):
+        taxonomy_name = file_path.stem.replace(TAXONOMY_OVERVIEW_SUFFIX, "")
+        taxonomies.append(taxonomy_name)
 
     return sorted(taxonomies)
 
 
+def load_taxonomies(world_path: Path) -> Dict[str, str]:
+    """Get every existing taxonomy with its description context in one pass.
+
+    Scans the taxonomies directory once and reads each overview through the
+    parsed-file cache, so callers can check existence, list taxonomies and
+    fetch context without touching the directory again.
+
+    Returns:
+        Mapping of taxonomy name to its overview description, sorted by name
+    """
+    taxonomies = {}
+    overview_suffix = f"{TAXONOMY_OVERVIEW_SUFFIX}{MARKDOWN_EXTENSION}"
+
+    try:
+        taxonomy_scan = os.scandir(os.path.join(world_path, "taxonomies"))
+    except OSError:
+        return taxonomies
+
+    with taxonomy_scan as overview_files:
+        for overview_file in overview_files:
+            if not overview_file.name.endswith(overview_suffix):
+                continue
+            try:
+                context = load_with_stat_cache(
+                    overview_file.path,
+                    _TAXONOMY_CONTEXT_CACHE,
+                    _read_taxonomy_description,
+                    stat_result=overview_file.stat(),
+                )
+            except Exception:
+                context = ""
+            taxonomies[overview_file.name[: -len(overview_suffix)]] = context
+
+    return dict(sorted(taxonomies.items()))
+
+
 def get_existing_entries(world_path: Path) -> List[Dict[str, str]]:
-    """Get a list of existing entries in the world."""
+    """Get a list of existing entries in the world.
+
+    Names come from the file names alone, so no entry file is opened or
+    stat'ed; use get_existing_entries_with_descriptions when descriptions
+    are needed.
+    """
     entries = []
-    entries_path = world_path / "entries"
 
-    if entries_path.exists():
-        for taxonomy_dir in entries_path.iterdir():
-            if taxonomy_dir.is_dir():
-                for entry_file in taxonomy_dir.glob(f"*{MARKDOWN_EXTENSION}"):
-                    entry_name = entry_file.stem.replace("-", " ").title()
+    try:
+        taxonomy_scan = os.scandir(os.path.join(world_path, "entries"))
+    except OSError:
+        return entries
+
+    with taxonomy_scan as taxonomy_dirs:
+        for taxonomy_dir in taxonomy_dirs:
+            if not taxonomy_dir.is_dir():
+                continue
+            try:
+                entry_scan = os.scandir(taxonomy_dir.path)
+            except OSError:
+                continue
+
+            with entry_scan as entry_files:
+                for entry_file in entry_files:
+                    if not (
+                        entry_file.name.endswith(MARKDOWN_EXTENSION)
+                        and entry_file.is_file()
+                    ):
+                        continue
+                    entry_stem = entry_file.name[: -len(MARKDOWN_EXTENSION)]
                     entries.append(
                         {
-                            "name": entry_name,
+                            "name": entry_stem.replace("-", " ").title(),
                             "taxonomy": taxonomy_dir.name,
-                            "file": str(entry_file.relative_to(world_path)),
+                            "file": os.path.join(
+                                "entries", taxonomy_dir.name, entry_file.name
+                            ),
                         }
                     )
 
@@ -88,29 +175,42 @@ def get_existing_entries(world_path: Path) -> List[Dict[str, str]]:
 def get_existing_entries_with_descriptions(world_path: Path) -> List[Dict[str, str]]:
     """Get a list of existing entries with their descriptions."""
     entries = []
-    entries_path = world_path / "entries"
 
-    if entries_path.exists():
-        for taxonomy_dir in entries_path.iterdir():
-            if taxonomy_dir.is_dir():
-                for entry_file in taxonomy_dir.glob(f"*{MARKDOWN_EXTENSION}"):
-                    try:
-                        with open(entry_file, "r", encoding="utf-8") as f:
-                            content = f.read()
+    try:
+        taxonomy_scan = os.scandir(os.path.join(world_path, "entries"))
+    except OSError:
+        return entries
 
-                        # Extract frontmatter to get description
-                        from ..utils.content_parsing import extract_frontmatter
+    with taxonomy_scan as taxonomy_dirs:
+        for taxonomy_dir in taxonomy_dirs:
+            if not taxonomy_dir.is_dir():
+                continue
+            try:
+                entry_scan = os.scandir(taxonomy_dir.path)
+            except OSError:
+                continue
 
-                        frontmatter, _ = extract_frontmatter(content)
-                        description = frontmatter.get("description", "")
+            with entry_scan as entry_files:
+                for entry_file in entry_files:
+                    if not entry_file.name.endswith(MARKDOWN_EXTENSION):
+                        continue
+                    try:
+                        description = load_with_stat_cache(
+                            entry_file.path,
+                            _ENTRY_DESCRIPTION_CACHE,
+                            _read_entry_description,
+                            stat_result=entry_file.stat(),
+                        )
 
-                        entry_name = entry_file.stem.replace("-", " ").title()
+                        entry_stem = entry_file.name[: -len(MARKDOWN_EXTENSION)]
                         entries.append(
                             {
-                                "name": entry_name,
+                                "name": entry_stem.replace("-", " ").title(),
                                 "taxonomy": taxonomy_dir.name,
                                 "description": description,
-                                "file": str(entry_file.relative_to(world_path)),
+                                "file": os.path.join(
+                                    "entries", taxonomy_dir.name, entry_file.name
+                                ),
                             }
                         )
                     except Exception:
@@ -120,6 +220,53 @@ def get_existing_entries_with_descriptions(world_path: Path) -> List[Dict[str, s
     return entries
 
 
+def _read_entry_description(entry_file: Union[str, Path]) -> str:
+    """Read the frontmatter description of an entry file."""
+    frontmatter, _ = extract_frontmatter(_read_frontmatter_block(entry_file))
+    return frontmatter.get("description", "")
+
+
+def _read_frontmatter_block(entry_file: Union[str, Path]) -> str:
+    """Read an entry's leading frontmatter block without loading its body.
+
+    The file is read in small chunks only until the closing ``---`` line,
+    so entry bodies are never paged in. Returns an empty string when the
+    file does not start with frontmatter.
+    """
+    with open(entry_file, "rb") as f:
+        head = bytearray()
+        line_start = 0
+        is_first_line = True
+        while True:
+            chunk = f.read(_FRONTMATTER_CHUNK_SIZE)
+            head.extend(chunk)
+            at_eof = not chunk
+
+            while True:
+                line_end = head.find(b"\n", line_start)
+                if line_end == -1:
+                    if not at_eof or line_start >= len(head):
+                        break
+                    line_end = len(head)
+
+                line = head[line_start:line_end].strip()
+                if is_first_line:
+                    if line != b"---":
+                        return ""
+                    is_first_line = False
+                elif line == b"---":
+                    return head[:line_end].decode("utf-8")
+                line_start = line_end + 1
+
+            if at_eof:
+                return head.decode("utf-8")
+
+
+def invalidate_entry_cache(entry_file: Union[str, Path]) -> None:
+    """Drop any cached description for an entry file after it is rewritten."""
+    _ENTRY_DESCRIPTION_CACHE.pop(str(entry_file), None)
+
+
 def create_world_context_prompt(
     existing_taxonomies: List[str],
     existing_entries: List[Dict[str, str]],
@@ -5,7 +5,7 @@ prompts, tools, and utilities.
 """
 
 import asyncio
-import os
+import logging
 from typing import Any, Sequence
 
 import mcp.server.stdio
@@ -13,7 +13,8 @@ import mcp.types as types
 from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 
-from .config import FAL_AVAILABLE, SERVER_NAME, VERSION
+from .config import SERVER_NAME, VERSION, close_fal_client
+from .entries.creation import wait_for_pending_images
 
 # Import prompt handlers
 from .prompts.core import CORE_PROMPT_HANDLERS, handle_core_prompt
@@ -30,27 +31,6 @@ from .tools.world import WORLD_HANDLERS, handle_world_tool
 from .types.schemas import get_all_tools
 
 
-# Load environment variables from .env file
-def load_env_file():
-    """Load environment variables from .env file if it exists."""
-    from pathlib import Path
-
-    env_path = Path(__file__).parent.parent / ".env"
-
-    if env_path.exists():
-        with open(env_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, value = line.split("=", 1)
-                    # Only set if not already in environment
-                    if key.strip() not in os.environ:
-                        os.environ[key.strip()] = value.strip()
-
-
-# Load .env file at startup
-load_env_file()
-
 # Initialize the MCP server
 app = Server(SERVER_NAME)
 
@@ -131,6 +111,8 @@ async def handle_get_prompt(
 @app.list_tools()
 async def handle_list_tools() -> list[types.Tool]:
     """List available worldbuilding tools."""
+    from .config import FAL_AVAILABLE
+
     return get_all_tools(include_fal_tools=FAL_AVAILABLE)
 
 
@@ -191,6 +173,8 @@ async def handle_call_tool(
 
 async def main():
     """Main entry point for the MCP server."""
+    # Log to stderr so diagnostics never interleave with the stdio protocol stream
+    logging.basicConfig(format="%(asctime)s %(name)s %(message)s")
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
         await app.run(
             read_stream,
@@ -205,6 +189,10 @@ async def main():
             ),
         )
 
+    # Let background entry images finish saving before the process exits
+    await wait_for_pending_images()
+    await close_fal_client()
+
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -4,6 +4,7 @@ This module provides the main tool handler interface for entry operations,
 delegating to the appropriate specialized modules in the entries package.
 """
 
+import logging
 from typing import Any
 
 import mcp.types as types
@@ -16,6 +17,8 @@ from ..entries.content_processing import (
 from ..entries.creation import create_world_entry
 from ..entries.stub_generation import create_stub_entries
 
+logger = logging.getLogger(__name__)
+
 # Tool router for entry operations
 ENTRY_HANDLERS = {
     "create_world_entry": create_world_entry,
@@ -41,23 +44,17 @@ async def handle_entry_tool(
     Raises:
         ValueError: If tool name is not recognized
     """
-    import datetime
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"[{timestamp}] [ENTRY HANDLER DEBUG] ===== ENTRY TOOL HANDLER CALLED =====")
-    print(f"[{timestamp}] [ENTRY HANDLER DEBUG] Tool name: {name}")
-    print(f"[{timestamp}] [ENTRY HANDLER DEBUG] Arguments: {arguments}")
-    
-    if name not in ENTRY_HANDLERS:
-        print(f"[{timestamp}] [ENTRY HANDLER DEBUG] Unknown entry tool: {name}")
-        raise ValueError(f"Unknown entry tool: {name}")
-
-    print(f"[{timestamp}] [ENTRY HANDLER DEBUG] Calling handler for {name}")
+    logger.debug("Entry tool called: %s", name)
+
+    try:
+        handler = ENTRY_HANDLERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown entry tool: {name}") from None
+
     try:
-        result = await ENTRY_HANDLERS[name](arguments)
-        print(f"[{timestamp}] [ENTRY HANDLER DEBUG] Handler completed successfully")
+        result = await handler(arguments)
+        logger.debug("Entry tool %s completed", name)
         return result
-    except Exception as e:
-        print(f"[{timestamp}] [ENTRY HANDLER DEBUG] Handler failed with exception: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Entry tool %s failed", name)
         raise
@@ -12,20 +12,16 @@ import mcp.types as types
 from ..config import (
     DEFAULT_IMAGE_ASPECT_RATIO,
     DEFAULT_IMAGE_STYLE,
-    FAL_API_KEY,
     FAL_API_URL,
-    FAL_AVAILABLE,
     IMAGE_EXTENSION,
     MAX_DESCRIPTION_LINES,
+    get_fal_client,
 )
 from ..utils.content_parsing import (
     extract_frontmatter,
     add_frontmatter_to_content,
 )
 
-if FAL_AVAILABLE:
-    import requests
-
 
 async def generate_image_prompt_for_entry(
     arguments: dict[str, Any] | None,
@@ -156,12 +152,14 @@ async def generate_image_from_markdown_file(
     Returns:
         List containing success message with image details or error message
     """
+    from ..config import FAL_API_KEY, HTTPX_AVAILABLE
+
     # Validate dependencies and arguments
-    if not FAL_AVAILABLE:
+    if not HTTPX_AVAILABLE:
         return [
             types.TextContent(
                 type="text",
-                text="Error: requests library not available. Please install with: pip install requests",
+                text="Error: httpx library not available. Please install with: pip install 'httpx[http2]'",
             )
         ]
 
@@ -350,6 +348,8 @@ async def _generate_image_via_fal(prompt: str, aspect_ratio: str) -> dict:
     Raises:
         Exception: If API request fails or returns no images
     """
+    from ..config import FAL_API_KEY
+
     headers = {
         "Authorization": f"Key {FAL_API_KEY}",
         "Content-Type": "application/json",
@@ -357,7 +357,8 @@ async def _generate_image_via_fal(prompt: str, aspect_ratio: str) -> dict:
 
     payload = {"prompt": prompt, "aspect_ratio": aspect_ratio, "num_images": 1}
 
-    response = requests.post(FAL_API_URL, headers=headers, json=payload, timeout=30)
+    client = get_fal_client()
+    response = await client.post(FAL_API_URL, headers=headers, json=payload)
 
     if response.status_code != 200:
         raise Exception(
@@ -371,7 +372,7 @@ async def _generate_image_via_fal(prompt: str, aspect_ratio: str) -> dict:
 
     # Download the image data
     image_url = result["images"][0]["url"]
-    image_response = requests.get(image_url, timeout=30)
+    image_response = await client.get(image_url)
 
     if image_response.status_code != 200:
         raise Exception(f"Failed to download image from {image_url}")
@@ -10,18 +10,12 @@ from typing import Any
 import mcp.types as types
 
 from ..config import (
-    FAL_API_KEY,
-    FAL_API_URL,
-    FAL_AVAILABLE,
     IMAGE_EXTENSION,
     MARKDOWN_EXTENSION,
     TAXONOMY_OVERVIEW_SUFFIX,
 )
 from ..utils.path_helpers import resolve_world_path
 
-if FAL_AVAILABLE:
-    import requests
-
 
 async def create_taxonomy_with_llm_guidelines(arguments: dict[str, Any] | None) -> list[types.TextContent]:
     """Create a taxonomy with LLM-generated guidelines in a single streamlined workflow.
@@ -14,18 +14,13 @@ import mcp.types as types
 from ..config import (
     DEFAULT_BASE_DIRECTORY,
     DEFAULT_UNIQUE_SUFFIX,
-    FAL_API_KEY,
     FAL_API_URL,
-    FAL_AVAILABLE,
     IMAGE_EXTENSION,
     MARKDOWN_EXTENSION,
     MAX_DESCRIPTION_LINES,
     WORLD_DIRECTORIES,
 )
 
-if FAL_AVAILABLE:
-    import requests
-
 
 async def instantiate_world(
     arguments: dict[str, Any] | None,
@@ -90,6 +85,8 @@ async def instantiate_world(
         )
 
         # Generate overview images and favicon if FAL API is available
+        from ..config import FAL_API_KEY, FAL_AVAILABLE
+
         image_generation_info = ""
         favicon_info = ""
         if FAL_API_KEY and FAL_AVAILABLE:
@@ -247,6 +244,8 @@ async def _generate_overview_images(
     Returns:
         Information string about generated images
     """
+    from ..config import FAL_API_KEY, FAL_AVAILABLE
+
     if not FAL_AVAILABLE:
         return ""
 
@@ -402,6 +401,8 @@ async def _generate_single_image(
     Returns:
         True if successful, False otherwise
     """
+    import requests
+
     try:
         payload = {
             "prompt": prompt,
@@ -570,9 +571,13 @@ async def _generate_world_favicon(
     Returns:
         Information string about favicon generation
     """
+    from ..config import FAL_API_KEY, FAL_AVAILABLE
+
     if not FAL_AVAILABLE:
         return ""
 
+    import requests
+
     try:
         headers = {
             "Authorization": f"Key {FAL_API_KEY}",
@@ -0,0 +1,95 @@
+"""Environment file loading for the Vibe Worldbuilding MCP.
+
+This module parses simple KEY=VALUE .env files and caches the parsed result
+in a JSON file next to the .env, so short-lived processes importing the
+configuration only pay a stat and a small JSON read on each start.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+ENV_CACHE_SUFFIX = ".cache.json"
+
+
+def load_env_file(env_path: Path) -> Dict[str, str]:
+    """Load variables from a .env file into os.environ.
+
+    Variables already present in the environment take precedence over
+    values from the file.
+
+    Args:
+        env_path: Path to the .env file
+
+    Returns:
+        Variables parsed from the file, or an empty dict if it doesn't exist
+    """
+    try:
+        env_stat = os.stat(env_path)
+    except OSError:
+        return {}
+
+    cache_key = [env_stat.st_mtime_ns, env_stat.st_size]
+    cache_path = env_path.with_name(env_path.name + ENV_CACHE_SUFFIX)
+
+    env_vars = _read_env_cache(cache_path, cache_key)
+    if env_vars is None:
+        env_vars = _parse_env_file(env_path)
+        _write_env_cache(cache_path, cache_key, env_vars)
+
+    os.environ.update(
+        {key: value for key, value in env_vars.items() if key not in os.environ}
+    )
+
+    return env_vars
+
+
+def _parse_env_file(env_path: Path) -> Dict[str, str]:
+    """Parse KEY=VALUE lines, skipping blanks, comments and lines without a key."""
+    text = env_path.read_text(encoding="utf-8")
+    return {
+        key.strip(): _unquote(value.strip())
+        for line in text.splitlines()
+        if (stripped := line.strip()) and not stripped.startswith("#")
+        for key, separator, value in [stripped.partition("=")]
+        if separator and key.strip()
+    }
+
+
+def _unquote(value: str) -> str:
+    """Strip one pair of matching surrounding quotes, as python-dotenv does."""
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    return value
+
+
+def _read_env_cache(cache_path: Path, cache_key: list) -> Optional[Dict[str, str]]:
+    """Return cached variables if the cache matches the .env's current stat."""
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cached, dict) or cached.get("key") != cache_key:
+        return None
+    return cached.get("variables")
+
+
+def _write_env_cache(
+    cache_path: Path, cache_key: list, env_vars: Dict[str, str]
+) -> None:
+    """Atomically write the parsed variables; failures only skip caching."""
+    temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        # The cache holds the same secrets as .env, so keep it private
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"key": cache_key, "variables": env_vars}, f)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
@@ -4,8 +4,11 @@ This module provides common file system operations used across
 the worldbuilding tools, with consistent error handling and validation.
 """
 
+import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar, Union
+
+T = TypeVar("T")
 
 
 def ensure_directory_exists(directory_path: Path) -> None:
@@ -142,6 +145,46 @@ def get_file_size(file_path: Path) -> Optional[int]:
         return None
 
 
+def load_with_stat_cache(
+    file_path: Union[str, Path],
+    cache: Dict[str, Tuple[int, int, T]],
+    loader: Callable[[Union[str, Path]], T],
+    stat_result: Optional[os.stat_result] = None,
+) -> T:
+    """Load a file through a loader, reusing the cached result while it is unchanged.
+
+    A path is considered unchanged while its modification time (in
+    nanoseconds) and size match the values recorded when the result was
+    cached, so a cache hit costs a single stat call.
+
+    Args:
+        file_path: Path to the file (or directory) to load
+        cache: Mapping of path string to (mtime_ns, size, loaded value)
+        loader: Function producing the value for the path on a cache miss
+        stat_result: Stat of the path if already known (e.g. from os.scandir)
+
+    Returns:
+        The cached or freshly loaded value
+
+    Raises:
+        OSError: If the path cannot be stat'ed; loader exceptions propagate
+    """
+    if stat_result is None:
+        stat_result = os.stat(file_path)
+    key = str(file_path)
+    cached = cache.get(key)
+    if (
+        cached is not None
+        and cached[0] == stat_result.st_mtime_ns
+        and cached[1] == stat_result.st_size
+    ):
+        return cached[2]
+
+    value = loader(file_path)
+    cache[key] = (stat_result.st_mtime_ns, stat_result.st_size, value)
+    return value
+
+
 def remove_file_safely(file_path: Path) -> bool:
     """Safely remove a file if it exists.
 
@@ -5,9 +5,22 @@ file paths used throughout the worldbuilding system.
 """
 
 import re
+import string
 from pathlib import Path
 from typing import List, Optional
 
+# Fallback patterns for names containing non-ASCII characters
+_INVALID_NAME_CHARS = re.compile(r"[^\w\-.]")
+_REPEATED_HYPHENS = re.compile(r"-+")
+
+# ASCII fast path: spaces and underscores become hyphens, and every other
+# ASCII character outside [A-Za-z0-9.-] is dropped (same result as the regexes)
+_ASCII_NAME_CHARS = set(string.ascii_letters + string.digits + "-.")
+_ASCII_CLEAN_TABLE = str.maketrans(
+    {chr(c): None for c in range(128) if chr(c) not in _ASCII_NAME_CHARS}
+    | {" ": "-", "_": "-"}
+)
+
 
 def clean_name_for_filesystem(name: str) -> str:
     """Clean a name to be safe for use in file and directory names.
@@ -18,14 +31,20 @@ def clean_name_for_filesystem(name: str) -> str:
     Returns:
         Cleaned name suitable for filesystem use
     """
+    if name.isascii():
+        cleaned = name.lower().translate(_ASCII_CLEAN_TABLE)
+        while "--" in cleaned:
+            cleaned = cleaned.replace("--", "-")
+        return cleaned.strip("-")
+
     # Convert to lowercase and replace spaces/underscores with hyphens
     cleaned = name.lower().replace(" ", "-").replace("_", "-")
 
     # Remove or replace problematic characters
-    cleaned = re.sub(r"[^\w\-.]", "", cleaned)
+    cleaned = _INVALID_NAME_CHARS.sub("", cleaned)
 
     # Remove multiple consecutive hyphens
-    cleaned = re.sub(r"-+", "-", cleaned)
+    cleaned = _REPEATED_HYPHENS.sub("-", cleaned)
 
     # Remove leading/trailing hyphens
     cleaned = cleaned.strip("-")